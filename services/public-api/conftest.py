@@ -3,71 +3,154 @@ Pytest configuration and shared fixtures for VibeBiz Public API
 """
 
 import asyncio
+import copy
+import functools
+import itertools
+import uuid
 from collections.abc import Callable, Generator
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from passlib.context import CryptContext
+
+import src.api
+from src.api import utils as api_utils
+
+# Frozen once at import so the session-scoped data templates below never
+# recompute timestamps.
+_FROZEN_NOW = datetime.now(UTC)
+_FROZEN_NOW_ISO = _FROZEN_NOW.isoformat()
+_FROZEN_NOW_TS = int(_FROZEN_NOW.timestamp())
+
+# Memoized password helpers. bcrypt is deliberately slow, so identical inputs are
+# hashed/verified once per session. Defined at module scope (wrapping the
+# originals captured at import) so patching can never make them recurse.
+_cached_hash_password = functools.lru_cache(maxsize=256)(api_utils.hash_password)
+_cached_verify_password = functools.lru_cache(maxsize=1024)(api_utils.verify_password)
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
     """
-    Create an instance of the default event loop for the test session.
+    Event loop policy used by pytest-asyncio for async tests.
+
+    Uses uvloop (installed with ``uvicorn[standard]`` on non-Windows platforms)
+    when available, falling back to the default asyncio policy.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return cast(asyncio.AbstractEventLoopPolicy, uvloop.EventLoopPolicy())
+
+
+@pytest.fixture(scope="session")
+def event_loop(
+    event_loop_policy: asyncio.AbstractEventLoopPolicy,
+) -> Generator[asyncio.AbstractEventLoop, None, None]:
+    """
+    Create an instance of the event loop for the test session.
     This is required for async tests to work properly.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    loop = event_loop_policy.new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest.fixture
-def mock_user() -> dict[str, Any]:
+@pytest.fixture(scope="session", autouse=True)
+def _detect_blocking_calls() -> Generator[None, None, None]:
     """
-    Create a mock user object for testing
+    Fail tests whose async code paths make blocking calls on the event loop.
+
+    Uses BlockBuster when it is installed; otherwise this is a no-op. Only
+    calls made from the service's own ``src`` package are flagged, so test
+    tooling and third-party clients don't produce false positives.
+    """
+    try:
+        from blockbuster import blockbuster_ctx
+    except ImportError:
+        yield
+        return
+
+    with blockbuster_ctx(scanned_modules=["src"]):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cache_password_hashing() -> Generator[None, None, None]:
+    """
+    Make password hashing cheap for the whole test session.
+
+    Swaps in a minimum-cost bcrypt context and routes ``hash_password`` /
+    ``verify_password`` lookups through ``src.api`` and ``src.api.utils`` to
+    the memoized wrappers. Modules that imported the functions by name before
+    the session started keep the originals, but still hash at reduced cost.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            api_utils,
+            "pwd_context",
+            CryptContext(schemes=["bcrypt"], bcrypt__rounds=4),
+        )
+        for module in (api_utils, src.api):
+            mp.setattr(module, "hash_password", _cached_hash_password)
+            mp.setattr(module, "verify_password", _cached_verify_password)
+        yield
+
+
+# Plain-text passwords shared by tests, hashed once per session
+TEST_PASSWORDS = ("secure_password_123",)  # nosec B105
+
+
+@pytest.fixture(scope="session")
+def precomputed_hashes(_cache_password_hashing: None) -> dict[str, str]:
+    """
+    Hash the shared test passwords once per session
 
     Returns:
-        Dictionary representing a user with common fields
+        Mapping of each password in ``TEST_PASSWORDS`` to its bcrypt hash
     """
+    return {password: api_utils.hash_password(password) for password in TEST_PASSWORDS}
+
+
+# Session-scoped templates. Each is built once per session; the public
+# function-scoped fixtures hand every test its own deep copy so mutations
+# never leak between tests.
+
+
+@pytest.fixture(scope="session")
+def _mock_user_template() -> dict[str, Any]:
+    """Build the mock user data once per session"""
     return {
         "id": "user-123",
         "email": "test@example.com",
         "full_name": "Test User",
         "avatar_url": "https://example.com/avatar.jpg",
-        "created_at": datetime.now(UTC).isoformat(),
-        "updated_at": datetime.now(UTC).isoformat(),
+        "created_at": _FROZEN_NOW_ISO,
+        "updated_at": _FROZEN_NOW_ISO,
         "status": "active",
     }
 
 
-@pytest.fixture
-def mock_organization() -> dict[str, Any]:
-    """
-    Create a mock organization object for testing
-
-    Returns:
-        Dictionary representing an organization with common fields
-    """
+@pytest.fixture(scope="session")
+def _mock_organization_template() -> dict[str, Any]:
+    """Build the mock organization data once per session"""
     return {
         "id": "org-123",
         "name": "Test Organization",
         "slug": "test-org",
         "settings": {"theme": "light", "notifications": True},
-        "created_at": datetime.now(UTC).isoformat(),
-        "updated_at": datetime.now(UTC).isoformat(),
+        "created_at": _FROZEN_NOW_ISO,
+        "updated_at": _FROZEN_NOW_ISO,
         "status": "active",
     }
 
 
-@pytest.fixture
-def mock_project() -> dict[str, Any]:
-    """
-    Create a mock project object for testing
-
-    Returns:
-        Dictionary representing a project with common fields
-    """
+@pytest.fixture(scope="session")
+def _mock_project_template() -> dict[str, Any]:
+    """Build the mock project data once per session"""
     return {
         "id": "project-123",
         "organization_id": "org-123",
@@ -76,45 +159,160 @@ def mock_project() -> dict[str, Any]:
         "description": "A test project for unit testing",
         "status": "active",
         "created_by": "user-123",
-        "created_at": datetime.now(UTC).isoformat(),
-        "updated_at": datetime.now(UTC).isoformat(),
+        "created_at": _FROZEN_NOW_ISO,
+        "updated_at": _FROZEN_NOW_ISO,
+    }
+
+
+@pytest.fixture(scope="session")
+def _mock_jwt_payload_template() -> dict[str, Any]:
+    """Build the mock JWT payload once per session"""
+    return {
+        "sub": "user-123",
+        "email": "test@example.com",
+        "org_id": "org-123",
+        "role": "admin",
+        "iat": _FROZEN_NOW_TS,
+        "exp": _FROZEN_NOW_TS + 3600,  # 1 hour from session start
+        "jti": "token-123",
+    }
+
+
+@pytest.fixture(scope="session")
+def _mock_pagination_template() -> dict[str, Any]:
+    """Build the mock pagination metadata once per session"""
+    return {
+        "page": 1,
+        "page_size": 20,
+        "total": 100,
+        "total_pages": 5,
+        "has_next": True,
+        "has_prev": False,
     }
 
 
+@pytest.fixture(scope="session")
+def _mock_request_context_template() -> dict[str, Any]:
+    """Build the mock request context once per session"""
+    return {
+        "request_id": "req-123",
+        "user_id": "user-123",
+        "organization_id": "org-123",
+        "ip_address": "127.0.0.1",
+        "user_agent": "pytest-test-client",
+        "timestamp": _FROZEN_NOW_ISO,
+    }
+
+
+@pytest.fixture(scope="session")
+def _sample_file_upload_template() -> dict[str, Any]:
+    """Build the sample file upload once per session"""
+    return {
+        "filename": "test_document.pdf",
+        "content_type": "application/pdf",
+        "size": 1024 * 1024,  # 1MB
+        "content": b"mock file content for testing",
+    }
+
+
+# Async Redis commands the mock client supports, with their default results
+_MOCK_REDIS_RETURN_VALUES: dict[str, Any] = {
+    "get": None,
+    "set": True,
+    "delete": 1,
+    "exists": False,
+    "expire": True,
+}
+
+
+@pytest.fixture(scope="session")
+def _mock_database_session_skeleton() -> AsyncMock:
+    """Build the mock database session once per session"""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    # spec'd on AsyncSession: coroutine methods become AsyncMocks automatically
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture(scope="session")
+def _mock_redis_client_skeleton() -> MagicMock:
+    """Build the mock Redis client once per session"""
+    redis_mock = MagicMock(spec=list(_MOCK_REDIS_RETURN_VALUES))
+    for command in _MOCK_REDIS_RETURN_VALUES:
+        setattr(redis_mock, command, AsyncMock())
+    return redis_mock
+
+
+@pytest.fixture
+def mock_user(_mock_user_template: dict[str, Any]) -> dict[str, Any]:
+    """
+    Create a mock user object for testing
+
+    Returns:
+        Dictionary representing a user with common fields
+    """
+    return copy.deepcopy(_mock_user_template)
+
+
 @pytest.fixture
-def mock_database_session() -> AsyncMock:
+def mock_organization(_mock_organization_template: dict[str, Any]) -> dict[str, Any]:
+    """
+    Create a mock organization object for testing
+
+    Returns:
+        Dictionary representing an organization with common fields
+    """
+    return copy.deepcopy(_mock_organization_template)
+
+
+@pytest.fixture
+def mock_project(_mock_project_template: dict[str, Any]) -> dict[str, Any]:
+    """
+    Create a mock project object for testing
+
+    Returns:
+        Dictionary representing a project with common fields
+    """
+    return copy.deepcopy(_mock_project_template)
+
+
+@pytest.fixture
+def mock_database_session(_mock_database_session_skeleton: AsyncMock) -> AsyncMock:
     """
     Create a mock database session for testing
 
+    The mock is shared across the session and fully reset before each test, so
+    configure ``return_value``/``side_effect`` instead of replacing attributes.
+
     Returns:
         AsyncMock object that simulates a database session
     """
-    session = AsyncMock()
-    session.commit = AsyncMock()
-    session.rollback = AsyncMock()
-    session.close = AsyncMock()
-    session.flush = AsyncMock()
-    session.refresh = AsyncMock()
-    return session
+    _mock_database_session_skeleton.reset_mock(return_value=True, side_effect=True)
+    return _mock_database_session_skeleton
 
 
 @pytest.fixture
-def mock_jwt_payload() -> dict[str, Any]:
+def mock_jwt_payload(_mock_jwt_payload_template: dict[str, Any]) -> dict[str, Any]:
     """
     Create a mock JWT payload for testing authentication
 
     Returns:
         Dictionary representing a decoded JWT token payload
     """
-    return {
-        "sub": "user-123",
-        "email": "test@example.com",
-        "org_id": "org-123",
-        "role": "admin",
-        "iat": int(datetime.now(UTC).timestamp()),
-        "exp": int(datetime.now(UTC).timestamp()) + 3600,  # 1 hour from now
-        "jti": "token-123",
-    }
+    return copy.deepcopy(_mock_jwt_payload_template)
+
+
+@pytest.fixture
+def deterministic_uuids(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Make ``uuid.uuid4`` return sequential, reproducible UUIDs for one test.
+
+    Generated ids become ``00000000-0000-0000-0000-000000000001``,
+    ``...0002`` and so on, which avoids the urandom read per call and allows
+    exact assertions on ids created by the code under test.
+    """
+    sequence = (uuid.UUID(int=i) for i in itertools.count(1))
+    monkeypatch.setattr(uuid, "uuid4", lambda: next(sequence))
 
 
 @pytest.fixture
@@ -133,85 +331,76 @@ def mock_api_response() -> Callable[[Any, int, str], dict[str, Any]]:
             "data": data,
             "status": status,
             "message": message,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": _FROZEN_NOW_ISO,
         }
 
     return _create_response
 
 
 @pytest.fixture
-def mock_pagination() -> dict[str, Any]:
+def mock_pagination(_mock_pagination_template: dict[str, Any]) -> dict[str, Any]:
     """
     Create a mock pagination object for testing list endpoints
 
     Returns:
         Dictionary representing pagination metadata
     """
-    return {
-        "page": 1,
-        "page_size": 20,
-        "total": 100,
-        "total_pages": 5,
-        "has_next": True,
-        "has_prev": False,
-    }
+    return copy.deepcopy(_mock_pagination_template)
 
 
 @pytest.fixture
-def mock_request_context() -> dict[str, Any]:
+def mock_request_context(
+    _mock_request_context_template: dict[str, Any],
+) -> dict[str, Any]:
     """
     Create a mock request context for testing middleware and dependencies
 
     Returns:
         Dictionary representing request context
     """
-    return {
-        "request_id": "req-123",
-        "user_id": "user-123",
-        "organization_id": "org-123",
-        "ip_address": "127.0.0.1",
-        "user_agent": "pytest-test-client",
-        "timestamp": datetime.now(UTC).isoformat(),
-    }
+    return copy.deepcopy(_mock_request_context_template)
 
 
 @pytest.fixture
-def mock_redis_client() -> MagicMock:
+def mock_redis_client(_mock_redis_client_skeleton: MagicMock) -> MagicMock:
     """
     Create a mock Redis client for testing caching and sessions
 
+    The mock is shared across the session and fully reset before each test, so
+    configure ``return_value``/``side_effect`` instead of replacing attributes.
+
     Returns:
         MagicMock object that simulates a Redis client
     """
-    redis_mock = MagicMock()
-    redis_mock.get = AsyncMock(return_value=None)
-    redis_mock.set = AsyncMock(return_value=True)
-    redis_mock.delete = AsyncMock(return_value=1)
-    redis_mock.exists = AsyncMock(return_value=False)
-    redis_mock.expire = AsyncMock(return_value=True)
-    return redis_mock
+    _mock_redis_client_skeleton.reset_mock(return_value=True, side_effect=True)
+    for command, value in _MOCK_REDIS_RETURN_VALUES.items():
+        getattr(_mock_redis_client_skeleton, command).return_value = value
+    return _mock_redis_client_skeleton
 
 
 @pytest.fixture
-def sample_file_upload() -> dict[str, Any]:
+def sample_file_upload(_sample_file_upload_template: dict[str, Any]) -> dict[str, Any]:
     """
     Create a sample file upload object for testing file handling
 
     Returns:
         Dictionary representing an uploaded file
     """
-    return {
-        "filename": "test_document.pdf",
-        "content_type": "application/pdf",
-        "size": 1024 * 1024,  # 1MB
-        "content": b"mock file content for testing",
-    }
+    return copy.deepcopy(_sample_file_upload_template)
 
 
-# Integration test fixtures (imported from utils)
+# Integration test fixtures (imported from utils). Plugins can only be
+# registered from the top-level conftest, so they are loaded here rather
+# than from tests/integration/conftest.py
+pytest_plugins = ["tests.utils.database"]
 
 
 # Test data factory functions
+
+# Monotonic counter giving every factory-built record a unique, stable id
+_factory_ids = itertools.count(1)
+
+
 def create_test_user(**overrides: Any) -> dict[str, Any]:
     """
     Factory function to create test user data with overrides
@@ -222,13 +411,15 @@ def create_test_user(**overrides: Any) -> dict[str, Any]:
     Returns:
         Dictionary representing a test user
     """
+    n = next(_factory_ids)
+    now = datetime.now(UTC).isoformat()
     default_user = {
-        "id": f"user-{id(overrides)}",
-        "email": f"test{id(overrides)}@example.com",
+        "id": f"user-{n}",
+        "email": f"test{n}@example.com",
         "full_name": "Test User",
         "status": "active",
-        "created_at": datetime.now(UTC).isoformat(),
-        "updated_at": datetime.now(UTC).isoformat(),
+        "created_at": now,
+        "updated_at": now,
     }
     default_user.update(overrides)
     return default_user
@@ -244,35 +435,43 @@ def create_test_organization(**overrides: Any) -> dict[str, Any]:
     Returns:
         Dictionary representing a test organization
     """
+    n = next(_factory_ids)
+    now = datetime.now(UTC).isoformat()
     default_org = {
-        "id": f"org-{id(overrides)}",
+        "id": f"org-{n}",
         "name": "Test Organization",
-        "slug": f"test-org-{id(overrides)}",
+        "slug": f"test-org-{n}",
         "status": "active",
-        "created_at": datetime.now(UTC).isoformat(),
-        "updated_at": datetime.now(UTC).isoformat(),
+        "created_at": now,
+        "updated_at": now,
     }
     default_org.update(overrides)
     return default_org
 
 
+# Markers that opt a test out of the default 'unit' marker
+_NON_UNIT_MARKERS = frozenset(
+    {
+        "integration",
+        "slow",
+        "auth",
+        "api",
+        "database",
+        "security",
+        "performance",
+    }
+)
+
+
 def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
     """
     Modify test collection to add default markers
     """
+    unit = pytest.mark.unit
     for item in items:
         # Add 'unit' marker to tests that don't have other markers
-        if not any(
-            marker.name
-            in [
-                "integration",
-                "slow",
-                "auth",
-                "api",
-                "database",
-                "security",
-                "performance",
-            ]
-            for marker in item.iter_markers()
-        ):
-            item.add_marker(pytest.mark.unit)
+        for marker in item.iter_markers():
+            if marker.name in _NON_UNIT_MARKERS:
+                break
+        else:
+            item.add_marker(unit)
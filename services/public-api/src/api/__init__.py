@@ -9,6 +9,7 @@ from .utils import (
     create_slug,
     format_datetime,
     generate_secure_token,
+    generate_secure_tokens,
     get_utc_now,
     hash_password,
     mask_sensitive_data,
@@ -22,6 +23,7 @@ __all__ = [
     "create_slug",
     "format_datetime",
     "generate_secure_token",
+    "generate_secure_tokens",
     "get_utc_now",
     "hash_password",
     "mask_sensitive_data",
@@ -2,9 +2,11 @@
 Utility functions for the VibeBiz Public API
 """
 
+import functools
 import re
 import secrets
 import string
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import urlparse
@@ -13,6 +15,38 @@ from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Patterns are compiled once at import instead of on every call
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_FILENAME_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9._-]")
+# RFC 5322 compliant regex
+_EMAIL_RE = re.compile(
+    r"""(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[a-z0-9-]*[a-z0-9]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])"""  # noqa: E501
+)
+# ASCII filenames (the common case) skip the regex: every ASCII byte outside
+# [a-zA-Z0-9._-], path separators included, is deleted by bytes.translate
+_FILENAME_SAFE_CHARS = (string.ascii_letters + string.digits + "._-").encode("ascii")
+_FILENAME_UNSAFE_BYTES = bytes(b for b in range(128) if b not in _FILENAME_SAFE_CHARS)
+
+# Random bytes are mapped onto the token alphabet with bytes.translate. Bytes
+# >= 248 (the largest multiple of 62 <= 256) are dropped so that every
+# character is equally likely.
+_TOKEN_ALPHABET = (string.ascii_letters + string.digits).encode("ascii")
+_TOKEN_BYTE_LIMIT = 256 - 256 % len(_TOKEN_ALPHABET)
+_TOKEN_BYTE_MAP = bytes(_TOKEN_ALPHABET[b % len(_TOKEN_ALPHABET)] for b in range(256))
+_TOKEN_REJECTED_BYTES = bytes(range(_TOKEN_BYTE_LIMIT, 256))
+
+_DEFAULT_SENSITIVE_KEYS = (
+    "password",
+    "token",
+    "secret",
+    "key",
+    "auth",
+    "credential",
+    "jwt",
+    "session",
+    "cookie",
+)
+
 
 def hash_password(password: str) -> str:
     """
@@ -51,14 +85,50 @@ def generate_secure_token(length: int = 32) -> str:
     Returns:
         A secure random token string
     """
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    return _random_token_chars(length).decode("ascii")
+
+
+def generate_secure_tokens(count: int, length: int = 32) -> list[str]:
+    """
+    Generate several cryptographically secure random tokens at once
+
+    All tokens are sliced from a single bulk random draw, which is much cheaper
+    than calling ``generate_secure_token`` in a loop.
+
+    Args:
+        count: The number of tokens to generate
+        length: The length of each token (default: 32)
+
+    Returns:
+        A list of secure random token strings
+    """
+    if count <= 0:
+        return []
+    if length <= 0:
+        return [""] * count
+
+    chars = _random_token_chars(count * length).decode("ascii")
+    return [chars[i : i + length] for i in range(0, count * length, length)]
+
+
+def _random_token_chars(size: int) -> bytes:
+    """Draw ``size`` uniformly distributed bytes from the token alphabet."""
+    chars = b""
+    while len(chars) < size:
+        # Over-draw slightly since ~3% of random bytes are rejected
+        raw = secrets.token_bytes(size + size // 16 + 8)
+        chars += raw.translate(_TOKEN_BYTE_MAP, _TOKEN_REJECTED_BYTES)
+    return chars[:size]
 
 
+@functools.lru_cache(maxsize=4096)
 def create_slug(name: str) -> str:
     """
     Create a URL-friendly slug from a name
 
+    Results are memoized per input string, since the same names are slugged
+    repeatedly; use ``create_slug.cache_clear()`` to reset.
+
     Args:
         name: The name to convert to a slug
 
@@ -66,7 +136,7 @@ def create_slug(name: str) -> str:
         A URL-friendly slug
     """
     # Convert to lowercase and replace non-alphanumeric with hyphens
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower())
+    slug = _SLUG_RE.sub("-", name.lower())
     # Remove leading/trailing hyphens
     slug = slug.strip("-")
     return slug
@@ -84,11 +154,16 @@ def sanitize_filename(filename: str) -> str:
     """
     # Remove path traversal attempts
     filename = filename.replace("..", "")
-    filename = filename.replace("/", "")
-    filename = filename.replace("\\", "")
 
     # Keep only alphanumeric, dots, hyphens, underscores
-    sanitized = re.sub(r"[^a-zA-Z0-9._-]", "", filename)
+    if filename.isascii():
+        sanitized = (
+            filename.encode("ascii")
+            .translate(None, _FILENAME_UNSAFE_BYTES)
+            .decode("ascii")
+        )
+    else:
+        sanitized = _FILENAME_UNSAFE_RE.sub("", filename)
 
     # Ensure it's not empty
     if not sanitized:
@@ -120,6 +195,15 @@ def format_datetime(dt: datetime) -> str:
     return dt.isoformat()
 
 
+@functools.lru_cache(maxsize=2048)
+def _parse_iso_datetime(dt_str: str) -> datetime | None:
+    """Parse an ISO string, memoized since the same timestamps recur often"""
+    try:
+        return datetime.fromisoformat(dt_str)
+    except ValueError:
+        return None
+
+
 def parse_datetime(dt_str: str) -> datetime | None:
     """
     Parse ISO datetime string.
@@ -132,10 +216,7 @@ def parse_datetime(dt_str: str) -> datetime | None:
     """
     if not isinstance(dt_str, str):
         return None
-    try:
-        return datetime.fromisoformat(dt_str)
-    except ValueError:
-        return None
+    return _parse_iso_datetime(dt_str)
 
 
 def validate_email(email: str) -> bool:
@@ -148,17 +229,20 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email format is valid, False otherwise.
     """
-    if not isinstance(email, str):
+    # Cheap checks first so oversized or obviously malformed input never
+    # reaches the regex
+    if not isinstance(email, str) or len(email) > 254 or "@" not in email:
         return False
-    # RFC 5322 compliant regex
-    pattern = r"""(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[a-z0-9-]*[a-z0-9]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])"""  # noqa: E501
-    if not re.match(pattern, email):
+    # Outside quoted local parts and address literals, "@" appears exactly once
+    # and dots never repeat, so most remaining bad input is rejected here too
+    if '"' not in email and "[" not in email:
+        if email.count("@") != 1 or ".." in email:
+            return False
+    if not _EMAIL_RE.fullmatch(email):
         return False
 
-    # Check for total length and local part length
-    if len(email) > 254:
-        return False
-    local_part, domain_part = email.split("@")
+    # Quoted local parts may themselves contain "@", so split on the last one
+    local_part = email.rpartition("@")[0]
     if len(local_part) > 64:
         return False
 
@@ -182,12 +266,68 @@ def validate_url(url: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=128)
+def _sensitive_key_matcher(extra_keys: tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Build (once per distinct set of extra keys) a predicate for sensitive keys
+
+    The same key names recur on every call, so the predicate memoizes its
+    verdict per key and only runs the regex for keys it has not seen yet.
+
+    Args:
+        extra_keys: Keys to mask in addition to the defaults.
+
+    Returns:
+        Predicate that is True for any key containing a sensitive substring.
+    """
+    keys = (*_DEFAULT_SENSITIVE_KEYS, *extra_keys)
+    search = re.compile("|".join(map(re.escape, keys))).search
+
+    @functools.lru_cache(maxsize=1024)
+    def is_sensitive(key: str) -> bool:
+        return search(key) is not None
+
+    return is_sensitive
+
+
+def _mask_value(value: Any) -> str:
+    """Mask a single sensitive value, showing first and last 2 chars of long strings"""
+    if isinstance(value, str) and len(value) > 4:
+        return value[:2] + "**********" + value[-2:]
+    # Short strings and non-string values are masked completely
+    return "***"
+
+
+def _mask_dict(
+    data: dict[str, Any], is_sensitive: Callable[[str], bool]
+) -> dict[str, Any]:
+    """Mask matching keys, copying ``data`` only once something has to change"""
+    masked_data: dict[str, Any] | None = None
+    for key, value in data.items():
+        if is_sensitive(key):
+            new_value: Any = _mask_value(value)
+        elif isinstance(value, dict):
+            # Recursively mask nested dictionaries
+            new_value = _mask_dict(value, is_sensitive)
+            if new_value is value:
+                continue
+        else:
+            continue
+        if masked_data is None:
+            masked_data = dict(data)
+        masked_data[key] = new_value
+    return data if masked_data is None else masked_data
+
+
 def mask_sensitive_data(
     data: dict[str, Any], sensitive_keys: tuple[str, ...] = ()
 ) -> dict[str, Any]:
     """
     Mask sensitive data in a dictionary for logging.
 
+    The input is never modified. When nothing in it needs masking, the input
+    dictionary itself is returned instead of a copy.
+
     Args:
         data: Dictionary containing data to mask.
         sensitive_keys: Tuple of keys to mask.
@@ -195,37 +335,4 @@ def mask_sensitive_data(
     Returns:
         Dictionary with sensitive values masked.
     """
-    default_sensitive_keys = {
-        "password",
-        "token",
-        "secret",
-        "key",
-        "auth",
-        "credential",
-        "jwt",
-        "session",
-        "cookie",
-    }
-    # Combine default and custom sensitive keys
-    keys_to_mask = default_sensitive_keys.union(sensitive_keys)
-
-    masked_data: dict[str, Any] = {}
-    for key, value in data.items():
-        # Check if the key contains any of the sensitive key strings
-        if any(k in key for k in keys_to_mask):
-            if isinstance(value, str):
-                if len(value) > 4:
-                    # Mask long strings, showing first and last 2 chars
-                    masked_data[key] = value[:2] + "**********" + value[-2:]
-                else:
-                    # For short strings, mask completely
-                    masked_data[key] = "***"
-            else:
-                # Mask non-string values completely
-                masked_data[key] = "***"
-        elif isinstance(value, dict):
-            # Recursively mask nested dictionaries
-            masked_data[key] = mask_sensitive_data(value, sensitive_keys)
-        else:
-            masked_data[key] = value
-    return masked_data
+    return _mask_dict(data, _sensitive_key_matcher(tuple(sensitive_keys)))
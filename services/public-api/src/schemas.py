@@ -4,11 +4,19 @@ Pydantic models for the application
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints
+
+# Email already validated upstream (at registration, invitation request or token
+# issuance). Only a cheap shape check runs in pydantic-core instead of full
+# email-validator parsing, which stays on User where the address is first parsed.
+TrustedEmailStr = Annotated[
+    str, StringConstraints(max_length=254, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+]
 
 
 class User(BaseModel):
@@ -111,6 +119,8 @@ class UserSession(BaseModel):
     UserSession model
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     user_id: str
     token_hash: str
@@ -126,9 +136,11 @@ class OrganizationInvitation(BaseModel):
     OrganizationInvitation model
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     organization_id: str
-    email: EmailStr
+    email: TrustedEmailStr
     role: Role
     token_hash: str
     status: InvitationStatus
@@ -142,6 +154,8 @@ class AuditLog(BaseModel):
     AuditLog model
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     organization_id: str
     user_id: str | None = None
@@ -153,6 +167,17 @@ class AuditLog(BaseModel):
     user_agent: str | None = None
     created_at: datetime
 
+    @classmethod
+    def build_trusted(cls, **data: Any) -> AuditLog:
+        """
+        Build an audit log entry from already-validated server-side data
+
+        Skips pydantic validation entirely, so callers must pass values of the
+        correct types; anything coming from a request must go through the
+        normal constructor instead.
+        """
+        return cls.model_construct(**data)
+
 
 class JWTPayload(BaseModel):
     """
@@ -160,9 +185,16 @@ class JWTPayload(BaseModel):
     """
 
     sub: str  # user_id
-    email: EmailStr
+    email: TrustedEmailStr
     org_id: str
     role: Role
     iat: int
     exp: int
     jti: str
+
+
+# Bound once at import so per-request token decoding calls pydantic-core
+# directly, skipping BaseModel.__init__ and the **kwargs copy.
+validate_jwt_payload: Callable[[Any], JWTPayload] = (
+    JWTPayload.__pydantic_validator__.validate_python
+)
@@ -0,0 +1,5 @@
+"""
+Tests for VibeBiz Public API
+
+This package contains the unit and integration test suites.
+"""
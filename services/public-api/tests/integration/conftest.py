@@ -2,17 +2,35 @@
 Minimal integration test fixtures.
 """
 
+import pathlib
 from collections.abc import AsyncGenerator
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from pytest_asyncio import is_async_test
 
+_INTEGRATION_DIR = pathlib.Path(__file__).parent
 
-@pytest.fixture
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Run async integration tests on the session event loop shared by the
+    session-scoped app and client fixtures.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and _INTEGRATION_DIR in item.path.parents:
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def app() -> AsyncGenerator[FastAPI, None]:
     """
     Create a minimal FastAPI application for integration testing.
+
+    Built once per session so routes are only registered a single time.
     """
     app = FastAPI(title="Test App")
 
@@ -23,10 +41,10 @@ async def app() -> AsyncGenerator[FastAPI, None]:
     yield app
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
     """
-    Create an HTTP client for the test app.
+    Create an HTTP client for the test app, shared across the session.
     """
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
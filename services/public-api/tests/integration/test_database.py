@@ -0,0 +1,141 @@
+"""
+Integration tests for the PostgreSQL test database fixtures.
+"""
+
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.utils import database
+from tests.utils.database import DatabaseTestManager
+
+_COUNT_ORGANIZATIONS = text("SELECT count(*) FROM organizations")
+
+# Slug of the row committed outside any test transaction
+_COMMITTED_SLUG = "committed-org"
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def committed_organization(
+    db_manager: DatabaseTestManager,
+) -> AsyncGenerator[None, None]:
+    """
+    Commit an organization outside the test transaction, deleting it afterwards
+    """
+    async with db_manager.raw_asyncpg() as raw_conn:
+        await raw_conn.execute(
+            "INSERT INTO organizations (name, slug) VALUES ($1, $2)",
+            "Committed Org",
+            _COMMITTED_SLUG,
+        )
+
+    yield
+
+    async with db_manager.raw_asyncpg() as raw_conn:
+        await raw_conn.execute(
+            "DELETE FROM organizations WHERE slug = $1", _COMMITTED_SLUG
+        )
+
+
+@pytest.mark.integration
+class TestDbSession:
+    """Test the rolled-back per-test database session"""
+
+    # Each run checks for an empty table and then commits a row, so whichever
+    # run comes second fails if the first one's write survived
+    @pytest.mark.parametrize("run", range(2))
+    async def test_writes_are_rolled_back(
+        self, run: int, db_session: AsyncSession
+    ) -> None:
+        """Test that a committed write is invisible to the next test"""
+        assert await db_session.scalar(_COUNT_ORGANIZATIONS) == 0  # nosec B101
+
+        await db_session.execute(
+            text("INSERT INTO organizations (name, slug) VALUES (:name, :slug)"),
+            {"name": f"Org {run}", "slug": f"org-{run}"},
+        )
+        await db_session.commit()
+
+        assert await db_session.scalar(_COUNT_ORGANIZATIONS) == 1  # nosec B101
+
+    @pytest.mark.needs_empty_db
+    @pytest.mark.usefixtures("committed_organization")
+    async def test_needs_empty_db_truncates(self, db_session: AsyncSession) -> None:
+        """Test that needs_empty_db starts from empty tables"""
+        assert await db_session.scalar(_COUNT_ORGANIZATIONS) == 0  # nosec B101
+
+    @pytest.mark.usefixtures("committed_organization")
+    async def test_committed_rows_are_visible(self, db_session: AsyncSession) -> None:
+        """Test that tables are not emptied unless the test asks for it"""
+        assert await db_session.scalar(_COUNT_ORGANIZATIONS) == 1  # nosec B101
+
+
+@pytest.mark.integration
+class TestRawAsyncpg:
+    """Test bulk loading through the raw asyncpg connection"""
+
+    async def test_copy_is_visible_to_session(
+        self, db_manager: DatabaseTestManager, db_session: AsyncSession
+    ) -> None:
+        """Test that rows copied on the session's connection are visible to it"""
+        async with db_manager.raw_asyncpg(db_session) as raw_conn:
+            await raw_conn.copy_records_to_table(
+                "organizations",
+                records=[("Copy A", "copy-a"), ("Copy B", "copy-b")],
+                columns=["name", "slug"],
+            )
+
+        result = await db_session.execute(
+            text("SELECT slug FROM organizations ORDER BY slug")
+        )
+
+        assert result.scalars().all() == ["copy-a", "copy-b"]  # nosec B101
+
+
+@pytest.mark.integration
+class TestTemplateDatabase:
+    """Test the schema template shared by the per-worker databases"""
+
+    async def test_stale_template_is_rebuilt(
+        self, db_manager: DatabaseTestManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a template recording another schema hash is rebuilt"""
+        # A template of its own, so the session's template is left untouched
+        monkeypatch.setattr(database, "TEMPLATE_DATABASE", f"tmpl_{uuid.uuid4().hex}")
+        await db_manager.create_template_database()
+        try:
+            template_engine = db_manager._create_engine(
+                db_manager._database_url(database.TEMPLATE_DATABASE)
+            )
+            try:
+                async with template_engine.begin() as conn:
+                    await conn.execute(
+                        text("UPDATE _schema_version SET hash = 'stale'")
+                    )
+                    await conn.execute(text("CREATE TABLE stale_marker (id INT)"))
+            finally:
+                await template_engine.dispose()
+
+            assert not await db_manager._template_is_current()  # nosec B101
+
+            await db_manager.create_template_database()
+
+            assert await db_manager._template_is_current()  # nosec B101
+            template_engine = db_manager._create_engine(
+                db_manager._database_url(database.TEMPLATE_DATABASE)
+            )
+            try:
+                async with template_engine.connect() as conn:
+                    marker = await conn.scalar(
+                        text("SELECT to_regclass('stale_marker')")
+                    )
+            finally:
+                await template_engine.dispose()
+
+            assert marker is None  # nosec B101
+        finally:
+            await db_manager.drop_template_database()
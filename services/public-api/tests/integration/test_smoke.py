@@ -2,15 +2,26 @@
 Basic smoke test to verify the integration testing framework.
 """
 
+import asyncio
+
 import pytest
 from httpx import AsyncClient
 
+# Smoke-checked endpoints and the JSON body each must return
+SMOKE_ENDPOINTS: dict[str, dict[str, str]] = {
+    "/healthz": {"status": "ok"},
+}
+
 
 @pytest.mark.integration
-async def test_health_check(client: AsyncClient) -> None:
+async def test_smoke_endpoints(client: AsyncClient) -> None:
     """
-    Tests that the health check endpoint returns a 200 OK response.
+    Tests that every smoke endpoint returns a 200 OK response.
+
+    All requests are issued concurrently on the shared client.
     """
-    response = await client.get("/healthz")
-    assert response.status_code == 200  # nosec B101
-    assert response.json() == {"status": "ok"}  # nosec B101
+    responses = await asyncio.gather(*(client.get(path) for path in SMOKE_ENDPOINTS))
+
+    for response, expected in zip(responses, SMOKE_ENDPOINTS.values(), strict=True):
+        assert response.status_code == 200  # nosec B101
+        assert response.json() == expected  # nosec B101
@@ -0,0 +1,104 @@
+"""
+Unit tests for the shared fixtures in conftest.py
+"""
+
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Captured at import, before any test can patch it
+_REAL_UUID4 = uuid.uuid4
+
+
+@pytest.mark.unit
+class TestSessionTemplates:
+    """Test that session-built mock data is handed out as independent copies"""
+
+    # Each run checks for pristine data and then mutates it, so whichever run
+    # comes second fails if the first one's changes leaked
+    @pytest.mark.parametrize("run", range(2))
+    def test_mutations_do_not_leak(
+        self,
+        run: int,
+        mock_user: dict[str, Any],
+        mock_organization: dict[str, Any],
+    ) -> None:
+        """Test that mutating a handed-out copy leaves the next test's copy intact"""
+        assert mock_user["email"] == "test@example.com"  # nosec
+        assert mock_organization["settings"] == {  # nosec
+            "theme": "light",
+            "notifications": True,
+        }
+
+        mock_user["email"] = f"changed{run}@example.com"
+        mock_organization["settings"]["theme"] = "dark"
+
+    def test_copy_is_not_the_template(
+        self,
+        mock_organization: dict[str, Any],
+        _mock_organization_template: dict[str, Any],
+    ) -> None:
+        """Test that nested values are copied rather than shared"""
+        assert mock_organization == _mock_organization_template  # nosec
+        assert mock_organization is not _mock_organization_template  # nosec
+        assert (  # nosec
+            mock_organization["settings"] is not _mock_organization_template["settings"]
+        )
+
+
+@pytest.mark.unit
+class TestSharedMocks:
+    """Test the session-shared, spec'd database and Redis mocks"""
+
+    def test_database_session_rejects_unknown_attributes(
+        self, mock_database_session: AsyncMock
+    ) -> None:
+        """Test that the mock only exposes AsyncSession's interface"""
+        with pytest.raises(AttributeError):
+            mock_database_session.not_a_session_method  # noqa: B018
+
+    def test_redis_client_rejects_unknown_commands(
+        self, mock_redis_client: MagicMock
+    ) -> None:
+        """Test that the mock only exposes the supported Redis commands"""
+        with pytest.raises(AttributeError):
+            mock_redis_client.hgetall  # noqa: B018
+
+    # Each run checks for a fresh mock and then configures and calls it, so
+    # whichever run comes second fails if the reset between tests is missing
+    @pytest.mark.parametrize("run", range(2))
+    async def test_mocks_are_reset_between_tests(
+        self,
+        run: int,
+        mock_database_session: AsyncMock,
+        mock_redis_client: MagicMock,
+    ) -> None:
+        """Test that calls and configured results do not carry over"""
+        assert mock_database_session.execute.await_count == 0  # nosec
+        assert await mock_database_session.scalar("SELECT 1") != 42  # nosec
+        assert await mock_redis_client.get("key") is None  # nosec
+        assert mock_redis_client.get.await_count == 1  # nosec
+
+        await mock_database_session.execute("SELECT 1")
+        mock_database_session.scalar.return_value = 42
+        mock_redis_client.get.return_value = b"cached"
+
+
+@pytest.mark.unit
+class TestDeterministicUuids:
+    """Test the opt-in sequential uuid4 fixture"""
+
+    @pytest.mark.usefixtures("deterministic_uuids")
+    def test_sequence(self) -> None:
+        """Test that uuid4 yields the documented sequence"""
+        assert uuid.uuid4() == uuid.UUID(  # nosec
+            "00000000-0000-0000-0000-000000000001"
+        )
+        assert uuid.uuid4() == uuid.UUID(int=2)  # nosec
+
+    def test_restored_after_use(self) -> None:
+        """Test that uuid4 is random again once the fixture's test is done"""
+        assert uuid.uuid4 is _REAL_UUID4  # nosec
+        assert uuid.uuid4().version == 4  # nosec
@@ -0,0 +1,113 @@
+"""
+Unit tests for the Pydantic schemas
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from src.schemas import (
+    AuditLog,
+    InvitationStatus,
+    JWTPayload,
+    OrganizationInvitation,
+    Role,
+    validate_jwt_payload,
+)
+
+FIXED_DT = datetime(2025, 1, 1, tzinfo=UTC)
+
+JWT_PAYLOAD: dict[str, Any] = {
+    "sub": "user-123",
+    "email": "test@example.com",
+    "org_id": "org-123",
+    "role": "admin",
+    "iat": 1735732800,
+    "exp": 1735736400,
+    "jti": "token-123",
+}
+
+
+@pytest.mark.unit
+class TestJWTPayload:
+    """Test JWT payload validation"""
+
+    def test_valid_payload(self) -> None:
+        """Test that a well-formed payload validates"""
+        payload = JWTPayload(**JWT_PAYLOAD)
+
+        assert payload.email == "test@example.com"  # nosec
+        assert payload.role is Role.ADMIN  # nosec
+
+    def test_validate_jwt_payload(self) -> None:
+        """Test that the bound validator builds the same model from a dict"""
+        payload = validate_jwt_payload(JWT_PAYLOAD)
+
+        assert isinstance(payload, JWTPayload)  # nosec
+        assert payload == JWTPayload.model_validate(JWT_PAYLOAD)  # nosec
+
+    @pytest.mark.parametrize(
+        "email", ["", "invalid", "user@domain", "user name@domain.com"]
+    )
+    def test_invalid_email(self, email: str) -> None:
+        """Test that a malformed email is rejected"""
+        with pytest.raises(ValidationError):
+            JWTPayload(**{**JWT_PAYLOAD, "email": email})
+
+    def test_email_too_long(self) -> None:
+        """Test that an over-long email is rejected"""
+        with pytest.raises(ValidationError):
+            JWTPayload(**{**JWT_PAYLOAD, "email": "a" * 250 + "@domain.com"})
+
+
+@pytest.mark.unit
+class TestAuditLog:
+    """Test audit log records"""
+
+    def test_audit_log_is_immutable(self) -> None:
+        """Test that audit log entries cannot be modified after creation"""
+        log = AuditLog(
+            id="log-123",
+            organization_id="org-123",
+            action="project.created",
+            created_at=FIXED_DT,
+        )
+
+        with pytest.raises(ValidationError):
+            log.action = "project.deleted"
+
+    def test_build_trusted_matches_validated(self) -> None:
+        """Test that trusted construction yields the same entry as validation"""
+        data: dict[str, Any] = {
+            "id": "log-123",
+            "organization_id": "org-123",
+            "action": "project.created",
+            "created_at": FIXED_DT,
+        }
+
+        log = AuditLog.build_trusted(**data)
+
+        assert log == AuditLog(**data)  # nosec
+        assert log.user_id is None  # nosec
+
+
+@pytest.mark.unit
+class TestOrganizationInvitation:
+    """Test organization invitation validation"""
+
+    def test_invalid_email(self) -> None:
+        """Test that a malformed invitation email is rejected"""
+        with pytest.raises(ValidationError):
+            OrganizationInvitation(
+                id="invite-123",
+                organization_id="org-123",
+                email="not-an-email",
+                role=Role.MEMBER,
+                token_hash="hash",  # nosec B106 # noqa: S106
+                status=InvitationStatus.PENDING,
+                expires_at=FIXED_DT + timedelta(days=7),
+                invited_by="user-123",
+                created_at=FIXED_DT,
+            )
@@ -2,7 +2,9 @@
 Unit tests for API utility functions
 """
 
+import string
 from datetime import UTC, datetime
+from typing import Any
 
 import pytest
 
@@ -12,8 +14,8 @@ from src.api.utils import (
     create_slug,
     format_datetime,
     generate_secure_token,
+    generate_secure_tokens,
     get_utc_now,
-    hash_password,
     mask_sensitive_data,
     parse_datetime,
     sanitize_filename,
@@ -22,6 +24,8 @@ from src.api.utils import (
     verify_password,
 )
 
+VALID_TOKEN_CHARS = frozenset(string.ascii_letters + string.digits)
+
 
 @pytest.mark.unit
 class TestSecureTokenGeneration:
@@ -43,113 +47,167 @@ class TestSecureTokenGeneration:
 
     def test_token_uniqueness(self) -> None:
         """Test that generated tokens are unique"""
-        tokens = [generate_secure_token() for _ in range(100)]
-        assert len(set(tokens)) == 100  # nosec # All tokens should be unique
+        # 64 draws of 32 base-62 characters make a collision practically impossible
+        seen: set[str] = set()
+        for _ in range(64):
+            token = generate_secure_token()
+            assert token not in seen  # nosec
+            seen.add(token)
 
     def test_token_characters(self) -> None:
         """Test that tokens contain only valid characters"""
         token = generate_secure_token()
-        valid_chars = set(
-            "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-        )
-        assert all(char in valid_chars for char in token)  # nosec
+        assert VALID_TOKEN_CHARS.issuperset(token)  # nosec
+
+    def test_bulk_generation(self) -> None:
+        """Test that bulk generation yields distinct tokens of the given length"""
+        tokens = generate_secure_tokens(64, 16)
+
+        assert len(tokens) == 64  # nosec
+        assert all(len(token) == 16 for token in tokens)  # nosec
+        assert len(set(tokens)) == 64  # nosec
+        assert VALID_TOKEN_CHARS.issuperset("".join(tokens))  # nosec
+
+    def test_bulk_generation_zero_length(self) -> None:
+        """Test that zero-length bulk tokens are empty, like a single token"""
+        assert generate_secure_tokens(3, 0) == ["", "", ""]  # nosec
+        assert generate_secure_token(0) == ""  # nosec
+
+    def test_bulk_generation_zero_count(self) -> None:
+        """Test that requesting no tokens returns an empty list"""
+        assert generate_secure_tokens(0) == []  # nosec
+
+
+VALID_EMAILS = (
+    "test@example.com",
+    "user.name@domain.co.uk",
+    "admin+tag@company.org",
+    "number123@test.io",
+    "user_name@test-domain.com",
+)
+
+INVALID_EMAILS = (
+    "",
+    "invalid",
+    "@domain.com",
+    "user@",
+    "user@domain",
+    "user name@domain.com",
+    "user..name@domain.com",
+    "user@domain..com",
+    "a" * 255 + "@domain.com",  # Too long
+    "user@domain.com trailing",
+)
 
 
 @pytest.mark.unit
 class TestEmailValidation:
     """Test email validation"""
 
-    def test_valid_emails(self) -> None:
+    @pytest.mark.parametrize("email", VALID_EMAILS)
+    def test_valid_emails(self, email: str) -> None:
         """Test validation of valid email addresses"""
-        valid_emails = [
-            "test@example.com",
-            "user.name@domain.co.uk",
-            "admin+tag@company.org",
-            "number123@test.io",
-            "user_name@test-domain.com",
-        ]
-
-        for email in valid_emails:
-            assert validate_email(email), f"Should be valid: {email}"  # nosec
-
-    def test_invalid_emails(self) -> None:
+        assert validate_email(email), f"Should be valid: {email}"  # nosec
+
+    @pytest.mark.parametrize("email", INVALID_EMAILS)
+    def test_invalid_emails(self, email: str) -> None:
         """Test validation of invalid email addresses"""
-        invalid_emails = [
-            "",
-            "invalid",
-            "@domain.com",
-            "user@",
-            "user@domain",
-            "user name@domain.com",
-            "user..name@domain.com",
-            "user@domain..com",
-            "a" * 255 + "@domain.com",  # Too long
-        ]
-
-        for email in invalid_emails:
-            assert not validate_email(email), f"Should be invalid: {email}"  # nosec
+        assert not validate_email(email), f"Should be invalid: {email}"  # nosec
 
 
 @pytest.mark.unit
 class TestSlugCreation:
     """Test slug creation from names"""
 
-    def test_basic_slug_creation(self) -> None:
+    @pytest.mark.parametrize(
+        ("name", "slug"),
+        [
+            ("Test Organization", "test-organization"),
+            ("My Company Name", "my-company-name"),
+        ],
+    )
+    def test_basic_slug_creation(self, name: str, slug: str) -> None:
         """Test basic slug creation"""
-        assert create_slug("Test Organization") == "test-organization"  # nosec
-        assert create_slug("My Company Name") == "my-company-name"  # nosec
-
-    def test_special_characters(self) -> None:
+        assert create_slug(name) == slug  # nosec
+
+    @pytest.mark.parametrize(
+        ("name", "slug"),
+        [
+            ("Company & Co!", "company-co"),
+            ("Test@Company#123", "test-company-123"),
+        ],
+    )
+    def test_special_characters(self, name: str, slug: str) -> None:
         """Test slug creation with special characters"""
-        assert create_slug("Company & Co!") == "company-co"  # nosec
-        assert create_slug("Test@Company#123") == "test-company-123"  # nosec
-
-    def test_multiple_spaces(self) -> None:
+        assert create_slug(name) == slug  # nosec
+
+    @pytest.mark.parametrize(
+        ("name", "slug"),
+        [
+            ("Test   Company", "test-company"),
+            ("  Test Company  ", "test-company"),
+        ],
+    )
+    def test_multiple_spaces(self, name: str, slug: str) -> None:
         """Test slug creation with multiple consecutive spaces"""
-        assert create_slug("Test   Company") == "test-company"  # nosec
-        assert create_slug("  Test Company  ") == "test-company"  # nosec
+        assert create_slug(name) == slug  # nosec
 
-    def test_edge_cases(self) -> None:
+    @pytest.mark.parametrize(("name", "slug"), [("", ""), ("123", "123"), ("---", "")])
+    def test_edge_cases(self, name: str, slug: str) -> None:
         """Test slug creation edge cases"""
-        assert create_slug("") == ""  # nosec
-        assert create_slug("123") == "123"  # nosec
-        assert create_slug("---") == ""  # nosec
+        assert create_slug(name) == slug  # nosec
+
+
+SAFE_FILENAMES = (
+    "document.pdf",
+    "image-01.jpg",
+    "archive.tar.gz",
+    "data_2025_Q1.csv",
+    "report.2025.xlsx",
+)
+
+DANGEROUS_FILENAMES = {
+    "../../etc/passwd": "etcpasswd",
+    "file\\with\\backslashes.txt": "filewithbackslashes.txt",
+    "file/with/slashes.txt": "filewithslashes.txt",
+    "file with spaces.txt": "filewithspaces.txt",
+    "file!@#$%^&*().txt": "file.txt",
+    "résumé/../2025.pdf": "rsum2025.pdf",  # Non-ASCII takes the regex path
+}
 
 
 @pytest.mark.unit
 class TestFilenameSanitization:
     """Test filename sanitization"""
 
-    def test_safe_filenames(self) -> None:
+    @pytest.mark.parametrize("filename", SAFE_FILENAMES)
+    def test_safe_filenames(self, filename: str) -> None:
         """Test that safe filenames remain unchanged"""
-        safe_filenames = [
-            "document.pdf",
-            "image-01.jpg",
-            "archive.tar.gz",
-            "data_2025_Q1.csv",
-            "report.2025.xlsx",
-        ]
-
-        for filename in safe_filenames:
-            assert sanitize_filename(filename) == filename  # nosec
-
-    def test_dangerous_filenames(self) -> None:
-        """Test sanitization of dangerous filenames"""
-        dangerous_map = {
-            "../../etc/passwd": "etcpasswd",
-            "file\\with\\backslashes.txt": "filewithbackslashes.txt",
-            "file/with/slashes.txt": "filewithslashes.txt",
-            "file with spaces.txt": "filewithspaces.txt",
-            "file!@#$%^&*().txt": "file.txt",
-        }
+        assert sanitize_filename(filename) == filename  # nosec
 
-        for dangerous, sanitized in dangerous_map.items():
-            assert sanitize_filename(dangerous) == sanitized  # nosec
+    @pytest.mark.parametrize(("dangerous", "sanitized"), DANGEROUS_FILENAMES.items())
+    def test_dangerous_filenames(self, dangerous: str, sanitized: str) -> None:
+        """Test sanitization of dangerous filenames"""
+        assert sanitize_filename(dangerous) == sanitized  # nosec
 
-    def test_empty_filename(self) -> None:
+    @pytest.mark.parametrize("filename", ["", "   "])
+    def test_empty_filename(self, filename: str) -> None:
         """Test sanitization of empty or invalid filenames"""
-        assert sanitize_filename("") == "file"  # nosec
-        assert sanitize_filename("   ") == "file"  # nosec
+        assert sanitize_filename(filename) == "file"  # nosec
+
+
+VALID_DATES = (
+    "2025-01-01T12:00:00+00:00",
+    "2025-01-01T12:00:00Z",
+    "2025-01-01T12:00:00",
+)
+
+INVALID_DATES = (
+    "",
+    "invalid",
+    "2025-13-01T12:00:00",  # Invalid month
+    "2025-01-32T12:00:00",  # Invalid day
+)
 
 
 @pytest.mark.unit
@@ -167,60 +225,57 @@ class TestDatetimeHandling:
         dt = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
         assert format_datetime(dt) == "2025-01-01T12:00:00+00:00"  # nosec
 
-    def test_parse_datetime_valid(self) -> None:
+    @pytest.mark.parametrize("date_str", VALID_DATES)
+    def test_parse_datetime_valid(self, date_str: str) -> None:
         """Test parsing valid datetime strings"""
-        valid_dates = [
-            "2025-01-01T12:00:00+00:00",
-            "2025-01-01T12:00:00Z",
-            "2025-01-01T12:00:00",
-        ]
-
-        for date_str in valid_dates:
-            result = parse_datetime(date_str)
-            assert isinstance(result, datetime)  # nosec
+        assert isinstance(parse_datetime(date_str), datetime)  # nosec
 
-    def test_parse_datetime_invalid(self) -> None:
+    @pytest.mark.parametrize("date_str", INVALID_DATES)
+    def test_parse_datetime_invalid(self, date_str: str) -> None:
         """Test parsing invalid datetime strings"""
-        invalid_dates = [
-            "",
-            "invalid",
-            "2025-13-01T12:00:00",  # Invalid month
-            "2025-01-32T12:00:00",  # Invalid day
-        ]
+        assert parse_datetime(date_str) is None  # nosec
+
+    def test_parse_datetime_non_string(self) -> None:
+        """Test that non-string input is rejected rather than parsed"""
+        assert parse_datetime(None) is None  # type: ignore[arg-type]  # nosec
+        assert parse_datetime(["2025-01-01"]) is None  # type: ignore[arg-type]  # nosec
 
-        for date_str in invalid_dates:
-            result = parse_datetime(date_str)
-            assert result is None  # nosec
+    def test_parse_datetime_repeated(self) -> None:
+        """Test that parsing the same string twice gives equal results"""
+        first = parse_datetime("2025-01-01T12:00:00+00:00")
+        assert first == parse_datetime("2025-01-01T12:00:00+00:00")  # nosec
+        assert first == datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)  # nosec
+
+
+VALID_URLS = (
+    "https://example.com",
+    "http://test.org",
+    "https://sub.domain.com/path",
+    "ftp://files.example.com",
+)
+
+INVALID_URLS = (
+    "",
+    "invalid",
+    "example.com",  # Missing scheme
+    "http://",  # Missing netloc
+    "not a url",
+)
 
 
 @pytest.mark.unit
 class TestUrlValidation:
     """Test URL validation"""
 
-    def test_valid_urls(self) -> None:
+    @pytest.mark.parametrize("url", VALID_URLS)
+    def test_valid_urls(self, url: str) -> None:
         """Test validation of valid URLs"""
-        valid_urls = [
-            "https://example.com",
-            "http://test.org",
-            "https://sub.domain.com/path",
-            "ftp://files.example.com",
-        ]
+        assert validate_url(url), f"Should be valid: {url}"  # nosec
 
-        for url in valid_urls:
-            assert validate_url(url), f"Should be valid: {url}"  # nosec
-
-    def test_invalid_urls(self) -> None:
+    @pytest.mark.parametrize("url", INVALID_URLS)
+    def test_invalid_urls(self, url: str) -> None:
         """Test validation of invalid URLs"""
-        invalid_urls = [
-            "",
-            "invalid",
-            "example.com",  # Missing scheme
-            "http://",  # Missing netloc
-            "not a url",
-        ]
-
-        for url in invalid_urls:
-            assert not validate_url(url), f"Should be invalid: {url}"  # nosec
+        assert not validate_url(url), f"Should be invalid: {url}"  # nosec
 
 
 @pytest.mark.unit
@@ -268,23 +323,43 @@ class TestSensitiveDataMasking:
         for key in ["password", "token", "key"]:
             assert masked[key] == "***"  # nosec
 
+    def test_nested_sensitive_values(self) -> None:
+        """Test masking inside nested dictionaries leaves the input untouched"""
+        data: dict[str, Any] = {
+            "user": {"name": "test", "api_token": "abcd1234"},
+            "id": 1,
+        }
+
+        masked = mask_sensitive_data(data)
+
+        assert masked["user"]["api_token"] == "ab**********34"  # nosec
+        assert masked["user"]["name"] == "test"  # nosec
+        assert data["user"]["api_token"] == "abcd1234"  # nosec
+
+    def test_no_sensitive_values(self) -> None:
+        """Test that data without sensitive keys is returned as-is"""
+        data = {"username": "testuser", "profile": {"theme": "dark"}}
+
+        assert mask_sensitive_data(data) is data  # nosec
+
 
 @pytest.mark.unit
 class TestPasswordHashing:
     """Test password hashing and verification"""
 
-    def test_hash_and_verify_password(self) -> None:
+    def test_hash_and_verify_password(self, precomputed_hashes: dict[str, str]) -> None:
         """Test that a password can be hashed and verified"""
         password = "secure_password_123"  # nosec
-        hashed = hash_password(password)
+        hashed = precomputed_hashes[password]
 
         assert hashed != password  # nosec
         assert verify_password(password, hashed)  # nosec
 
-    def test_verify_incorrect_password(self) -> None:
+    def test_verify_incorrect_password(
+        self, precomputed_hashes: dict[str, str]
+    ) -> None:
         """Test that an incorrect password fails verification"""
-        password = "secure_password_123"  # nosec
-        hashed = hash_password(password)
+        hashed = precomputed_hashes["secure_password_123"]
 
         assert not verify_password("wrong_password", hashed)  # nosec
 
@@ -296,11 +371,11 @@ def test_token_generation_performance() -> None:
     """Test token generation performance"""
     import time
 
-    start_time = time.time()
-    tokens = [generate_secure_token() for _ in range(1000)]
-    end_time = time.time()
+    start_ns = time.perf_counter_ns()
+    tokens = generate_secure_tokens(1000)
+    elapsed_ns = time.perf_counter_ns() - start_ns
 
     # Should generate 1000 tokens in less than 1 second
-    assert end_time - start_time < 1.0  # nosec
+    assert elapsed_ns < 1_000_000_000  # nosec
     assert len(tokens) == 1000  # nosec
     assert len(set(tokens)) == 1000  # nosec # All unique
@@ -2,38 +2,103 @@
 Database utilities for integration testing
 """
 
+import contextlib
+import functools
+import hashlib
+import os
 import pathlib
-from collections.abc import AsyncGenerator
+import uuid
+import warnings
+from collections.abc import AsyncGenerator, AsyncIterator, Generator
 
+import asyncpg
 import pytest
-from sqlalchemy import text
+import pytest_asyncio
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 from testcontainers.postgres import PostgresContainer
 
+_SCHEMA_PATH = pathlib.Path(__file__).parent / "schema.sql"
+_INIT_TEMPLATE_PATH = pathlib.Path(__file__).parent / "init-template.sql"
+
+# Database holding the test schema; per-test databases are cloned from it
+TEMPLATE_DATABASE = "vibebiz_tmpl"
+
+# Session-level advisory lock serializing template builds across workers
+_TEMPLATE_LOCK_KEY = 0x76696265
+_LOCK_TEMPLATE = text(f"SELECT pg_advisory_lock({_TEMPLATE_LOCK_KEY})")
+_UNLOCK_TEMPLATE = text(f"SELECT pg_advisory_unlock({_TEMPLATE_LOCK_KEY})")
+_TEMPLATE_EXISTS = text("SELECT 1 FROM pg_database WHERE datname = :name")
+
+_READ_SCHEMA_HASH = "SELECT hash FROM _schema_version"
+
+_TEST_TABLES = (
+    "audit_logs",
+    "organization_invitations",
+    "user_sessions",
+    "projects",
+    "organization_members",
+    "organizations",
+    "users",
+)
+_TRUNCATE_TABLES = text(
+    f"TRUNCATE TABLE {', '.join(_TEST_TABLES)} RESTART IDENTITY CASCADE"
+)
+_DROP_TABLES = f"DROP TABLE IF EXISTS {', '.join(_TEST_TABLES)}, _schema_version"
+
 
 class DatabaseTestManager:
     """
     Manages PostgreSQL database for integration tests using testcontainers
     """
 
-    def __init__(self) -> None:
+    def __init__(self, worker_id: str = "master") -> None:
+        self.worker_id = worker_id
         self.container: PostgresContainer | None = None
         self.engine: AsyncEngine | None = None
         self.session_factory: async_sessionmaker[AsyncSession] | None = None
         self._db_url: str | None = None
+        self._admin_engine: AsyncEngine | None = None
 
     def start_container(self) -> str:
         """
         Start PostgreSQL container and return connection URL
 
+        When ``TEST_DATABASE_URL`` is set, that server is used instead and no
+        container is started. pytest-xdist workers require it: they share one
+        server, each with its own cloned database, rather than starting a
+        container per worker.
+
         Returns:
             Database connection URL
+
+        Raises:
+            RuntimeError: If running as an xdist worker without
+                ``TEST_DATABASE_URL``
         """
+        if self._db_url is not None:
+            return self._db_url
+
+        env_url = os.environ.get("TEST_DATABASE_URL")
+        if env_url:
+            url = make_url(env_url).set(drivername="postgresql+asyncpg")
+            self._db_url = url.render_as_string(hide_password=False)
+            return self._db_url
+
+        if self.worker_id != "master":
+            raise RuntimeError(
+                "Parallel database tests need one shared PostgreSQL server; "
+                "set TEST_DATABASE_URL (e.g. postgresql://postgres:postgres@"
+                "localhost:5432/test_db) before running with pytest-xdist"
+            )
+
         if self.container is None:
             self.container = PostgresContainer(
                 image="postgres:15-alpine",
@@ -42,17 +107,25 @@ class DatabaseTestManager:
                 dbname="test_db",
                 port=5432,
             )
+            # Build the template during initdb, before the container reports
+            # ready, so create_template_database finds it already in place
+            self.container.with_volume_mapping(_SCHEMA_PATH, "/vibebiz/schema.sql")
+            self.container.with_volume_mapping(
+                _INIT_TEMPLATE_PATH, "/docker-entrypoint-initdb.d/00-template.sql"
+            )
+            self.container.with_env("VIBEBIZ_SCHEMA_HASH", _schema_hash())
             self.container.start()
 
         if self.container is None:
             raise RuntimeError("Container not started")
-        # Get connection URL and convert to async format
-        sync_url = self.container.get_connection_url()
-        # Parse URL to rebuild with asyncpg driver
-        from urllib.parse import urlparse
-
-        parsed = urlparse(sync_url)
-        self._db_url = f"postgresql+asyncpg://{parsed.username}:{parsed.password}@{parsed.hostname}:{parsed.port}{parsed.path}"
+        # Build the asyncpg URL straight from the container's settings
+        container = self.container
+        host = container.get_container_host_ip()
+        port = container.get_exposed_port(container.port)
+        self._db_url = (
+            f"postgresql+asyncpg://{container.username}:{container.password}"
+            f"@{host}:{port}/{container.dbname}"
+        )
         return self._db_url
 
     def stop_container(self) -> None:
@@ -60,10 +133,14 @@ class DatabaseTestManager:
         if self.container:
             self.container.stop()
             self.container = None
+            self._db_url = None
 
-    async def setup_database(self) -> None:
+    async def setup_database(self, database: str | None = None) -> None:
         """
         Set up database engine and session factory
+
+        Args:
+            database: Database to bind to instead of the container's default
         """
         if not self._db_url:
             self.start_container()
@@ -71,30 +148,92 @@ class DatabaseTestManager:
         if self._db_url is None:
             raise RuntimeError("Database URL could not be determined.")
 
-        self.engine = create_async_engine(
-            self._db_url,
+        url = self._database_url(database) if database else self._db_url
+        self.engine = self._create_engine(url)
+        self.session_factory = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+
+        # Open the first pooled connection now, so the first test does not pay
+        # for the TCP handshake and authentication
+        async with self.engine.connect():
+            pass
+
+    def _create_engine(self, url: str) -> AsyncEngine:
+        """
+        Create an async engine with the test connection settings
+
+        Args:
+            url: Database connection URL
+
+        Returns:
+            Async engine for the given database
+        """
+        return create_async_engine(
+            url,
             echo=False,  # Set to True for SQL debugging
-            pool_size=1,  # Single connection for testing
-            max_overflow=0,  # No overflow connections
-            pool_pre_ping=True,
-            pool_recycle=300,
+            # Nothing can go stale in a short-lived test container, so skip the
+            # pre-ping round-trip on every checkout
+            pool_pre_ping=False,
             connect_args={
+                # Each test query runs about once, so per-connection prepared
+                # statement caches only cost memory
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                # Fail a hung query instead of stalling the whole run
+                "command_timeout": 30,
                 "server_settings": {
                     "application_name": "vibebiz_test",
-                }
+                },
             },
         )
 
-        self.session_factory = async_sessionmaker(
-            self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
+    def _database_url(self, database: str) -> str:
+        """
+        Build the connection URL for another database on the same server
+
+        Args:
+            database: Name of the database to connect to
+
+        Returns:
+            Database connection URL
+        """
+        if self._db_url is None:
+            raise RuntimeError("Database URL could not be determined.")
+        url = make_url(self._db_url).set(database=database)
+        return url.render_as_string(hide_password=False)
+
+    def _get_admin_engine(self) -> AsyncEngine:
+        """
+        Get the autocommit engine used for CREATE/DROP DATABASE statements
+
+        Returns:
+            Async engine connected to the maintenance database
+        """
+        if self._admin_engine is None:
+            if not self._db_url:
+                self.start_container()
+
+            if self._db_url is None:
+                raise RuntimeError("Database URL could not be determined.")
+
+            self._admin_engine = create_async_engine(
+                self._db_url, isolation_level="AUTOCOMMIT", poolclass=NullPool
+            )
+        return self._admin_engine
 
     async def create_tables(self) -> None:
         """
         Create database tables for testing by executing schema.sql
         Note: In a real implementation, this would use Alembic migrations
+
+        The hash of schema.sql is recorded in ``_schema_version``; when it
+        matches, the database is already up to date and nothing is run.
+        Otherwise the test tables are dropped and recreated. Both the lookup
+        and the DDL run on the raw asyncpg connection, bypassing SQLAlchemy's
+        statement compilation and transaction bookkeeping.
         """
         if not self.engine:
             await self.setup_database()
@@ -102,52 +241,240 @@ class DatabaseTestManager:
         if not self.engine:
             raise RuntimeError("Database engine not initialized")
 
-        schema_path = pathlib.Path(__file__).parent / "schema.sql"
-        if not schema_path.is_file():
-            raise FileNotFoundError(f"Schema file not found at {schema_path}")
+        async with self.raw_asyncpg() as raw_conn:
+            if await _read_schema_hash(raw_conn) == _schema_hash():
+                return
+            await raw_conn.execute(_versioned_schema())
 
-        schema_sql = schema_path.read_text()
+    async def create_template_database(self) -> None:
+        """
+        Build the schema once into the template database
 
-        async with self.engine.begin() as conn:
-            await conn.execute(text(schema_sql))
+        Per-test databases are cloned from it with ``CREATE DATABASE ...
+        TEMPLATE``, a file-level copy inside PostgreSQL that is much faster
+        than re-running the DDL for every test.
+
+        Several workers may share one server (see ``TEST_DATABASE_URL``), so
+        the build is serialized with an advisory lock and skipped when the
+        template already exists. A template built from an older schema.sql,
+        e.g. left behind on a long-lived server, is dropped and rebuilt.
+        """
+        async with self._get_admin_engine().connect() as conn:
+            await conn.execute(_LOCK_TEMPLATE)
+            try:
+                exists = await conn.scalar(
+                    _TEMPLATE_EXISTS, {"name": TEMPLATE_DATABASE}
+                )
+                if exists and not await self._template_is_current():
+                    await self._drop_template(conn)
+                    exists = False
+                if not exists:
+                    await self._build_template(conn)
+            finally:
+                await conn.execute(_UNLOCK_TEMPLATE)
+
+    async def drop_template_database(self) -> None:
+        """
+        Drop the template database, so the next session rebuilds it
+        """
+        async with self._get_admin_engine().connect() as conn:
+            await conn.execute(_LOCK_TEMPLATE)
+            try:
+                exists = await conn.scalar(
+                    _TEMPLATE_EXISTS, {"name": TEMPLATE_DATABASE}
+                )
+                if exists:
+                    await self._drop_template(conn)
+            finally:
+                await conn.execute(_UNLOCK_TEMPLATE)
+
+    async def _drop_template(self, admin_conn: AsyncConnection) -> None:
+        """
+        Drop the template database
+
+        Args:
+            admin_conn: Autocommit connection to the maintenance database
+        """
+        # PostgreSQL refuses to drop a database still marked as a template
+        await admin_conn.execute(
+            text(f'ALTER DATABASE "{TEMPLATE_DATABASE}" IS_TEMPLATE false')
+        )
+        await admin_conn.execute(
+            text(f'DROP DATABASE "{TEMPLATE_DATABASE}" WITH (FORCE)')
+        )
+
+    async def _template_is_current(self) -> bool:
+        """
+        Check whether the template database was built from this schema.sql
+
+        Returns:
+            True if the template's recorded schema hash matches
+        """
+        template_engine = self._create_engine(self._database_url(TEMPLATE_DATABASE))
+        try:
+            async with template_engine.connect() as conn:
+                raw_conn = await conn.get_raw_connection()
+                recorded = await _read_schema_hash(raw_conn.driver_connection)
+        finally:
+            # Cloning fails while any session is connected to the template
+            await template_engine.dispose()
+        return recorded == _schema_hash()
+
+    async def _build_template(self, admin_conn: AsyncConnection) -> None:
+        """
+        Create the template database and apply the schema to it
+
+        Args:
+            admin_conn: Autocommit connection to the maintenance database
+        """
+        await admin_conn.execute(text(f'CREATE DATABASE "{TEMPLATE_DATABASE}"'))
+
+        template_engine = self._create_engine(self._database_url(TEMPLATE_DATABASE))
+        try:
+            async with template_engine.begin() as conn:
+                await _execute_script(conn, _versioned_schema())
+        finally:
+            # Cloning fails while any session is connected to the template
+            await template_engine.dispose()
+
+        await admin_conn.execute(
+            text(f'ALTER DATABASE "{TEMPLATE_DATABASE}" IS_TEMPLATE true')
+        )
+
+    async def _clone_template(self, database: str) -> None:
+        """
+        Create a database as a copy of the template database
+
+        Args:
+            database: Name of the database to create
+        """
+        async with self._get_admin_engine().connect() as conn:
+            await conn.execute(
+                text(f'CREATE DATABASE "{database}" TEMPLATE "{TEMPLATE_DATABASE}"')
+            )
+
+    async def _drop_database(self, database: str) -> None:
+        """
+        Drop a database, terminating any sessions still connected to it
+
+        Args:
+            database: Name of the database to drop
+        """
+        async with self._get_admin_engine().connect() as conn:
+            await conn.execute(
+                text(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)')
+            )
+
+    @property
+    def worker_database(self) -> str:
+        """Name of the database owned by this pytest-xdist worker"""
+        return f"test_{self.worker_id}"
+
+    async def create_worker_database(self) -> None:
+        """
+        Clone this worker's database from the template and bind to it
+
+        Every pytest-xdist worker gets a database of its own, so workers never
+        contend for the same rows or locks.
+        """
+        await self._drop_database(self.worker_database)
+        await self._clone_template(self.worker_database)
+        await self.setup_database(self.worker_database)
+
+    async def drop_worker_database(self) -> None:
+        """Drop this worker's database once its tests have finished"""
+        if self.engine:
+            await self.engine.dispose()
+        await self._drop_database(self.worker_database)
+
+    @contextlib.asynccontextmanager
+    async def cloned_database(self) -> AsyncIterator[None]:
+        """
+        Point the manager at a fresh clone of the template database
+
+        The engine and session factory are swapped for ones bound to the clone
+        and restored on exit, after which the clone is dropped.
+        """
+        database = f"t_{uuid.uuid4().hex}"
+        await self._clone_template(database)
+
+        engine, session_factory = self.engine, self.session_factory
+        await self.setup_database(database)
+        try:
+            yield
+        finally:
+            if self.engine:
+                await self.engine.dispose()
+            self.engine, self.session_factory = engine, session_factory
+            await self._drop_database(database)
+
+    async def dispose(self) -> None:
+        """Close every connection held by the manager's engines"""
+        if self.engine:
+            await self.engine.dispose()
+        if self._admin_engine:
+            await self._admin_engine.dispose()
+            self._admin_engine = None
 
     async def cleanup_database(self) -> None:
         """
-        Clean up database by dropping all tables
+        Clean up database by emptying all tables
+
+        A single TRUNCATE clears every table in one round-trip and keeps the
+        schema, so nothing has to be recreated afterwards.
         """
         if not self.engine:
             return
 
-        # Drop tables in reverse order to handle foreign key constraints
-        drop_statements = [
-            "DROP TABLE IF EXISTS audit_logs CASCADE",
-            "DROP TABLE IF EXISTS organization_invitations CASCADE",
-            "DROP TABLE IF EXISTS user_sessions CASCADE",
-            "DROP TABLE IF EXISTS projects CASCADE",
-            "DROP TABLE IF EXISTS organization_members CASCADE",
-            "DROP TABLE IF EXISTS organizations CASCADE",
-            "DROP TABLE IF EXISTS users CASCADE",
-        ]
-
         async with self.engine.begin() as conn:
-            for drop_sql in drop_statements:
-                await conn.execute(text(drop_sql))
+            await conn.execute(_TRUNCATE_TABLES)
 
-    async def get_session(self) -> AsyncSession:
+    def get_session(self) -> AsyncSession:
         """
         Get a database session
 
+        Creating a session does no I/O, so this is synchronous; call
+        ``setup_database`` (as the ``db_manager`` fixture does) beforehand.
+
         Returns:
             Async database session
         """
-        if not self.session_factory:
-            await self.setup_database()
-
         if not self.session_factory:
             raise RuntimeError("Session factory not initialized")
 
         return self.session_factory()
 
+    @contextlib.asynccontextmanager
+    async def raw_asyncpg(
+        self, session: AsyncSession | None = None
+    ) -> AsyncIterator[asyncpg.Connection]:
+        """
+        Borrow the underlying asyncpg connection for bulk data loads
+
+        Seeding fixture rows with ``copy_records_to_table`` sends them as one
+        binary COPY rather than one INSERT round-trip per row.
+
+        Args:
+            session: Session whose connection to use, so loaded rows are rolled
+                back with it (e.g. ``db_session``). Without one, a connection
+                is taken from the engine and rows are committed immediately.
+
+        Yields:
+            The asyncpg driver connection
+        """
+        if session is not None:
+            conn = await session.connection()
+            raw_conn = await conn.get_raw_connection()
+            yield raw_conn.driver_connection
+            return
+
+        if not self.engine:
+            raise RuntimeError("Database engine not initialized")
+
+        async with self.engine.connect() as conn:
+            raw_conn = await conn.get_raw_connection()
+            yield raw_conn.driver_connection
+
     async def rollback_transaction(self, session: AsyncSession) -> None:
         """
         Rollback database transaction for test isolation
@@ -159,6 +486,82 @@ class DatabaseTestManager:
         await session.close()
 
 
+async def _execute_script(conn: AsyncConnection, sql: str) -> None:
+    """
+    Run a multi-statement SQL script in a single round-trip
+
+    SQLAlchemy's asyncpg dialect prepares every statement, and PostgreSQL
+    rejects prepared statements containing several commands. The raw asyncpg
+    connection sends parameterless SQL over the simple query protocol instead,
+    so the whole script travels as one message and runs as one implicit
+    transaction.
+
+    Args:
+        conn: Connection to run the script on
+        sql: Semicolon-separated SQL statements
+    """
+    raw_conn = await conn.get_raw_connection()
+    await raw_conn.driver_connection.execute(sql)  # type: ignore[union-attr]
+
+
+@functools.lru_cache(maxsize=1)
+def _read_schema() -> str:
+    """
+    Read the test schema DDL, once per process
+
+    Returns:
+        Contents of schema.sql
+    """
+    if not _SCHEMA_PATH.is_file():
+        raise FileNotFoundError(f"Schema file not found at {_SCHEMA_PATH}")
+    return _SCHEMA_PATH.read_text()
+
+
+@functools.lru_cache(maxsize=1)
+def _schema_hash() -> str:
+    """
+    Hash the test schema DDL, once per process
+
+    Returns:
+        Hex SHA-256 digest of schema.sql
+    """
+    return hashlib.sha256(_read_schema().encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _versioned_schema() -> str:
+    """
+    Build the script that (re)creates the schema and records its hash
+
+    Existing test tables are dropped first, since schema.sql only creates
+    what is missing and would otherwise leave outdated tables in place.
+
+    Returns:
+        SQL script to run in a single round-trip
+    """
+    return (
+        f"{_DROP_TABLES};\n{_read_schema()}\n"
+        f"INSERT INTO _schema_version (hash) VALUES ('{_schema_hash()}');"
+    )
+
+
+async def _read_schema_hash(raw_conn: asyncpg.Connection) -> str | None:
+    """
+    Read the schema hash recorded in a database
+
+    Args:
+        raw_conn: asyncpg connection to the database to inspect
+
+    Returns:
+        The recorded hash, or None if the schema was never applied
+    """
+    try:
+        recorded: str | None = await raw_conn.fetchval(_READ_SCHEMA_HASH)
+    except asyncpg.UndefinedTableError:
+        return None
+    return recorded
+
+
 # Global database manager instance
 _db_manager: DatabaseTestManager | None = None
 
@@ -167,16 +570,20 @@ def get_db_manager() -> DatabaseTestManager:
     """
     Get or create global database manager instance
 
+    Each pytest-xdist worker is its own process, so this is one manager per
+    worker, named after the worker (``master`` when not running under xdist).
+
     Returns:
         Database test manager instance
     """
     global _db_manager
     if _db_manager is None:
-        _db_manager = DatabaseTestManager()
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        _db_manager = DatabaseTestManager(worker_id)
     return _db_manager
 
 
-@pytest.fixture(scope="session")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def db_manager() -> AsyncGenerator[DatabaseTestManager, None]:
     """
     Database manager fixture for integration tests
@@ -186,57 +593,80 @@ async def db_manager() -> AsyncGenerator[DatabaseTestManager, None]:
     """
     manager = get_db_manager()
     manager.start_container()
-    await manager.setup_database()
-    await manager.create_tables()
+    await manager.create_template_database()
+    await manager.create_worker_database()
 
     yield manager
 
-    await manager.cleanup_database()
+    await manager.drop_worker_database()
+    await manager.dispose()
     manager.stop_container()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def db_session(
+    request: pytest.FixtureRequest,
     db_manager: DatabaseTestManager,
 ) -> AsyncGenerator[AsyncSession, None]:
     """
     Database session fixture with automatic transaction rollback
 
+    The session is bound to a connection inside an outer transaction, and its
+    own commits only release SAVEPOINTs. Rolling back the outer transaction
+    afterwards discards everything the test wrote, without any DDL. Tests
+    marked ``needs_empty_db`` additionally start from truncated tables; the
+    TRUNCATE is part of the same transaction and is rolled back with it.
+
     Args:
+        request: Pytest request for the test using the session
         db_manager: Database manager instance
 
     Yields:
         Database session that will be rolled back after test
     """
-    session = await db_manager.get_session()
-
-    try:
-        # Use the session directly - let SQLAlchemy handle transactions
-        yield session
-    finally:
-        # Close the session properly
-        if session.is_active:
-            await session.rollback()
-        await session.close()
+    if not db_manager.engine:
+        raise RuntimeError("Database engine not initialized")
+
+    async with db_manager.engine.connect() as conn:
+        transaction = await conn.begin()
+        if request.node.get_closest_marker("needs_empty_db"):
+            await conn.execute(_TRUNCATE_TABLES)
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
 
 
 @pytest.fixture
-async def clean_database(db_manager: DatabaseTestManager) -> AsyncGenerator[None, None]:
+def clean_database(
+    request: pytest.FixtureRequest,
+    db_session: AsyncSession,
+) -> Generator[None, None, None]:
     """
-    Fixture that ensures a clean database state
+    Deprecated alias for ``db_session``
+
+    ``db_session`` already undoes everything a test writes, so there is no
+    cleanup left to do here. Request ``db_session`` directly, and mark tests
+    that must start from empty tables with ``@pytest.mark.needs_empty_db``.
 
     Args:
-        db_manager: Database manager instance
+        request: Pytest request for the test using the fixture
+        db_session: Rolled-back database session for the test
 
     Yields:
         None
     """
-    # Clean up before test
-    await db_manager.cleanup_database()
-    await db_manager.create_tables()
-
+    # A stacklevel would point into pytest's fixture machinery, so name the
+    # requesting test in the message instead
+    warnings.warn(  # noqa: B028
+        f"{request.node.nodeid}: clean_database is deprecated; use db_session, "
+        "with @pytest.mark.needs_empty_db if the test needs empty tables",
+        DeprecationWarning,
+    )
     yield
-
-    # Clean up after test
-    await db_manager.cleanup_database()
-    await db_manager.create_tables()
@@ -0,0 +1,12 @@
+-- Container init script: builds the template database that per-test databases
+-- are cloned from, while the container boots. Mounted into
+-- /docker-entrypoint-initdb.d by DatabaseTestManager.start_container, with
+-- schema.sql mounted alongside it; the database name must match
+-- TEMPLATE_DATABASE in database.py. VIBEBIZ_SCHEMA_HASH is passed in the
+-- container environment so the template is stamped like one built from Python.
+CREATE DATABASE vibebiz_tmpl;
+\connect vibebiz_tmpl
+\i /vibebiz/schema.sql
+\getenv schema_hash VIBEBIZ_SCHEMA_HASH
+INSERT INTO _schema_version (hash) VALUES (:'schema_hash');
+ALTER DATABASE vibebiz_tmpl IS_TEMPLATE true;
@@ -92,6 +92,11 @@ CREATE TABLE IF NOT EXISTS audit_logs (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- SHA-256 of this file, recorded by the test harness once it has been applied
+CREATE TABLE IF NOT EXISTS _schema_version (
+    hash TEXT PRIMARY KEY
+);
+
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 CREATE INDEX IF NOT EXISTS idx_users_status ON users(status);